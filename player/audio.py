@@ -1,5 +1,7 @@
 """Audio player implementation using python-mpv."""
 
+from typing import Callable
+
 import mpv
 
 
@@ -15,6 +17,7 @@ class AudioPlayer:
         # ytdl=True allows mpv to directly handle some URLs if needed
         self.mpv = mpv.MPV(vo='null', ytdl=True)
         self.mpv.volume = 80
+        self._time_observers: dict[Callable, Callable] = {}
 
     def play(self, url: str) -> None:
         """Play audio from URL."""
@@ -43,6 +46,26 @@ class AudioPlayer:
         """Get total duration in seconds."""
         return self.mpv.duration or 1
 
+    def observe_time(self, callback: Callable[[float | None], None]) -> None:
+        """Call callback whenever the playback position changes.
+        
+        The callback runs on mpv's event thread, not the caller's.
+        
+        Args:
+            callback: Receives the new position in seconds, or None when idle
+        """
+        def handler(_name: str, value: float | None) -> None:
+            callback(value)
+
+        self._time_observers[callback] = handler
+        self.mpv.observe_property('time-pos', handler)
+
+    def unobserve_time(self, callback: Callable[[float | None], None]) -> None:
+        """Stop calling a callback registered with observe_time."""
+        handler = self._time_observers.pop(callback, None)
+        if handler is not None:
+            self.mpv.unobserve_property('time-pos', handler)
+
     def change_volume(self, delta: int) -> float:
         """Adjust volume by delta and clamp to 0-150.
         
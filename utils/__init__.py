@@ -1,6 +1,21 @@
 """Utility modules for YTUI Music."""
 
 from .search import YouTubeSearch
-from .thumbnails import get_thumbnail_url
+from .thumbnails import (
+    THUMB_SESSION,
+    ThumbnailCache,
+    download_thumbnail,
+    get_thumbnail_url,
+    load_thumbnail,
+    warm_thumbnail_connection,
+)
 
-__all__ = ["YouTubeSearch", "get_thumbnail_url"]
+__all__ = [
+    "YouTubeSearch",
+    "THUMB_SESSION",
+    "ThumbnailCache",
+    "download_thumbnail",
+    "get_thumbnail_url",
+    "load_thumbnail",
+    "warm_thumbnail_connection",
+]
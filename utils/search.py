@@ -1,10 +1,17 @@
 """YouTube search functionality using yt-dlp."""
 
 import asyncio
+import threading
 from typing import Any
 
 import yt_dlp
 
+from .thumbnails import get_thumbnail_url
+
+# Result rows render the thumbnail in a few terminal cells, so the small
+# variant carries all the detail that survives downscaling.
+SEARCH_THUMB_QUALITY = "mqdefault"
+
 
 class YouTubeSearch:
     """YouTube search using yt-dlp.
@@ -19,11 +26,59 @@ class YouTubeSearch:
             max_results: Maximum number of results to fetch (default: 30)
         """
         self.max_results = max_results
+        # Only title/uploader/id are used, so keep yt-dlp to the flat
+        # search listing and skip probes that don't affect it.
         self._opts = {
             'quiet': True,
-            'extract_flat': True,
+            'no_warnings': True,
+            'noprogress': True,
+            'extract_flat': 'in_playlist',
             'skip_download': True,
+            'playlist_items': f'1-{max_results}',
+            'youtube_include_dash_manifest': False,
+            'extractor_retries': 1,
+            'extractor_args': {'youtubetab': {'skip': ['authcheck']}},
         }
+        # Built once and reused; constructing YoutubeDL loads every
+        # extractor. The lock keeps concurrent searches off the instance;
+        # a search that finds it busy uses a throwaway instance instead.
+        self._ydl: yt_dlp.YoutubeDL | None = None
+        self._lock = threading.Lock()
+
+    def _get_ydl(self) -> yt_dlp.YoutubeDL:
+        # Caller must hold self._lock
+        if self._ydl is None:
+            self._ydl = yt_dlp.YoutubeDL(self._opts)
+        return self._ydl
+
+    def _extract(self, search_term: str) -> dict[str, Any]:
+        """Run the flat search extraction (blocking)."""
+        if self._lock.acquire(blocking=False):
+            try:
+                return self._get_ydl().extract_info(
+                    search_term, download=False
+                )
+            finally:
+                self._lock.release()
+
+        # A superseded search still holds the shared instance; don't queue
+        # the new query behind it
+        with yt_dlp.YoutubeDL(self._opts) as ydl:
+            return ydl.extract_info(search_term, download=False)
+
+    def warm(self) -> None:
+        """Construct the yt-dlp instance ahead of the first search (blocking)."""
+        with self._lock:
+            self._get_ydl()
+
+    def close(self) -> None:
+        """Release the yt-dlp instance.
+        
+        Doesn't take the lock, so shutdown never waits on a search that is
+        still running in an executor thread.
+        """
+        if self._ydl is not None:
+            self._ydl.close()
 
     async def search(self, query: str) -> list[dict[str, Any]]:
         """Search YouTube for videos.
@@ -44,12 +99,7 @@ class YouTubeSearch:
         search_term = f"ytsearch{self.max_results}:{query}"
         
         loop = asyncio.get_running_loop()
-        
-        def _extract():
-            with yt_dlp.YoutubeDL(self._opts) as ydl:
-                return ydl.extract_info(search_term, download=False)
-        
-        info = await loop.run_in_executor(None, _extract)
+        info = await loop.run_in_executor(None, self._extract, search_term)
         
         results = []
         if info.get('entries'):
@@ -59,19 +109,9 @@ class YouTubeSearch:
                     'title': entry.get('title', 'Unknown'),
                     'uploader': entry.get('uploader', 'Unknown'),
                     'id': vid_id,
-                    'thumbnail': get_thumbnail_url(vid_id),
+                    'thumbnail': get_thumbnail_url(
+                        vid_id, SEARCH_THUMB_QUALITY
+                    ),
                 })
         
         return results
-
-
-def get_thumbnail_url(video_id: str) -> str:
-    """Generate YouTube thumbnail URL for video ID.
-    
-    Args:
-        video_id: YouTube video ID
-        
-    Returns:
-        High-quality thumbnail URL
-    """
-    return f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
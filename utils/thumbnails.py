@@ -1,30 +1,165 @@
 """Thumbnail fetching and caching utilities."""
 
 import asyncio
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from pathlib import Path
 
 import requests
+from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session so every thumbnail request reuses the same pooled,
+# keep-alive connection to i.ytimg.com instead of a fresh TLS handshake.
+THUMB_SESSION = requests.Session()
+THUMB_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
+
+# Pixel box for inline result thumbnails: the 8x3 cell thumb box at
+# typical terminal cell sizes, so the renderer never resamples a full JPEG.
+INLINE_THUMB_SIZE = (96, 56)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "ytui_music" / "thumbs"
 
 
 class ThumbnailCache:
-    """In-memory cache for video thumbnails.
+    """Size-bounded LRU cache for video thumbnails.
     
-    Caches thumbnail bytes by video ID for the session duration.
+    Holds the downscaled PNGs produced by ``load_thumbnail`` in memory
+    and mirrors them to disk so they survive restarts. The least recently
+    used entry is evicted from both once more than ``max_items``
+    thumbnails are cached.
     """
+
+    SUFFIX = ".png"
     
-    def __init__(self):
-        self._cache: dict[str, bytes] = {}
+    def __init__(
+        self,
+        max_items: int = 512,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+    ):
+        """Initialize cache and index thumbnails left by earlier sessions.
+        
+        Args:
+            max_items: Maximum number of thumbnails to keep (default: 512)
+            cache_dir: Directory holding the on-disk copies
+        """
+        self.max_items = max_items
+        self.cache_dir = cache_dir
+        # Oldest first; a value of None means "on disk, not yet loaded"
+        self._cache: OrderedDict[str, bytes | None] = OrderedDict()
+        # All file I/O after startup runs on one thread, off the event loop
+        # and in submission order, so a write can't race its own eviction
+        self._io = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="thumb-cache"
+        )
+
+        try:
+            entries = list(self.cache_dir.iterdir())
+        except OSError:
+            entries = []
+
+        # Handle each entry on its own so one bad file can't stop indexing
+        files: list[tuple[float, str]] = []
+        for path in entries:
+            try:
+                if path.suffix == ".jpg":
+                    # Full-size JPEGs left by older versions
+                    path.unlink(missing_ok=True)
+                elif path.suffix == self.SUFFIX and path.is_file():
+                    files.append((path.stat().st_mtime, path.stem))
+            except OSError:
+                continue
+        for _, video_id in sorted(files):
+            self._cache[video_id] = None
+        self._evict()
+
+    def _path(self, video_id: str) -> Path:
+        return self.cache_dir / f"{video_id}{self.SUFFIX}"
+
+    def _unlink(self, video_id: str) -> None:
+        try:
+            self._path(video_id).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def _read(self, video_id: str) -> bytes | None:
+        try:
+            content = self._path(video_id).read_bytes()
+        except OSError:
+            return None
+        self._touch(video_id)
+        return content
+
+    def _write(self, video_id: str, content: bytes) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._path(video_id).write_bytes(content)
+        except OSError as e:
+            logging.error(f"Thumbnail cache write error: {e}")
+
+    def _touch(self, video_id: str) -> None:
+        try:
+            # Keep recency on disk so the LRU order survives restarts
+            os.utime(self._path(video_id))
+        except OSError:
+            pass
 
     def get(self, video_id: str) -> bytes | None:
-        """Get cached thumbnail for video ID."""
-        return self._cache.get(video_id)
+        """Get a thumbnail already held in memory, without touching disk.
+        
+        Entries only present on disk return None; use ``load`` for those.
+        """
+        content = self._cache.get(video_id)
+        if content is not None:
+            self._cache.move_to_end(video_id)
+            self._io.submit(self._touch, video_id)
+        return content
+
+    async def load(self, video_id: str) -> bytes | None:
+        """Get cached thumbnail, reading on-disk entries off the event loop."""
+        content = self.get(video_id)
+        if content is not None or video_id not in self._cache:
+            return content
+
+        loop = asyncio.get_running_loop()
+        content = await loop.run_in_executor(self._io, self._read, video_id)
+        if video_id in self._cache:
+            if content is None:
+                del self._cache[video_id]
+            else:
+                self._cache[video_id] = content
+                self._cache.move_to_end(video_id)
+        return content
 
     def set(self, video_id: str, content: bytes) -> None:
-        """Cache thumbnail content."""
+        """Cache thumbnail content in memory and on disk."""
         self._cache[video_id] = content
+        self._cache.move_to_end(video_id)
+        self._io.submit(self._write, video_id, content)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond ``max_items``."""
+        while len(self._cache) > self.max_items:
+            video_id, _ = self._cache.popitem(last=False)
+            self._io.submit(self._unlink, video_id)
 
     def clear(self) -> None:
         """Clear all cached thumbnails."""
+        for video_id in self._cache:
+            self._io.submit(self._unlink, video_id)
         self._cache.clear()
 
 
@@ -40,26 +175,95 @@ async def fetch_thumbnail(url: str, timeout: int = 10) -> bytes | None:
     """
     try:
         loop = asyncio.get_running_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: requests.get(url, timeout=timeout)
+        return await loop.run_in_executor(
+            None, download_thumbnail, url, timeout
         )
-        
-        if response.status_code == 200:
-            return response.content
     except Exception:
         pass
     
     return None
 
 
-def get_thumbnail_url(video_id: str) -> str:
+def download_thumbnail(url: str, timeout: int = 10) -> bytes | None:
+    """Download thumbnail bytes over the shared session (blocking).
+    
+    Args:
+        url: Thumbnail image URL
+        timeout: Request timeout in seconds
+        
+    Returns:
+        Image bytes or None on a non-200 response
+    """
+    response = THUMB_SESSION.get(url, timeout=timeout)
+    if response.status_code == 200:
+        return response.content
+    return None
+
+
+def shrink_thumbnail(
+    content: bytes,
+    size: tuple[int, int] = INLINE_THUMB_SIZE
+) -> bytes:
+    """Downscale an image to fit within size and re-encode it as PNG.
+    
+    Args:
+        content: Encoded image bytes
+        size: Maximum (width, height) in pixels
+        
+    Returns:
+        PNG image bytes
+    """
+    with Image.open(BytesIO(content)) as im:
+        im.thumbnail(size, Image.Resampling.BILINEAR)
+        buf = BytesIO()
+        im.save(buf, "PNG", optimize=False)
+    return buf.getvalue()
+
+
+def load_thumbnail(
+    url: str,
+    size: tuple[int, int] = INLINE_THUMB_SIZE,
+    timeout: int = 10
+) -> bytes | None:
+    """Download and downscale a thumbnail.
+    
+    Blocking; meant to run in an executor so decoding stays off the
+    event loop.
+    
+    Args:
+        url: Thumbnail image URL
+        size: Maximum (width, height) in pixels
+        timeout: Request timeout in seconds
+        
+    Returns:
+        Downscaled PNG bytes, or None if the download fails
+    """
+    content = download_thumbnail(url, timeout)
+    if content is None:
+        return None
+    return shrink_thumbnail(content, size)
+
+
+def warm_thumbnail_connection(timeout: int = 5) -> None:
+    """Open a pooled connection to the thumbnail host ahead of first use.
+    
+    Blocking; meant to run in an executor at startup.
+    
+    Args:
+        timeout: Request timeout in seconds
+    """
+    THUMB_SESSION.head("https://i.ytimg.com/", timeout=timeout)
+
+
+def get_thumbnail_url(video_id: str, quality: str = "mqdefault") -> str:
     """Generate YouTube thumbnail URL for video ID.
     
     Args:
         video_id: YouTube video ID
+        quality: Thumbnail variant, e.g. "default" (120x90),
+            "mqdefault" (320x180) or "hqdefault" (480x360)
         
     Returns:
-        High-quality thumbnail URL
+        Thumbnail URL
     """
-    return f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
+    return f"https://i.ytimg.com/vi/{video_id}/{quality}.jpg"
@@ -1,11 +1,11 @@
 """Search result list item widget with thumbnail support."""
 
-from functools import partial
 from io import BytesIO
 
 from textual.widgets import Static, Label, ListView, ListItem
 from textual.containers import Horizontal
 from textual_image.widget import Image as TextualImage
+from PIL import Image as PILImage
 
 
 class SearchResultItem(ListItem):
@@ -26,15 +26,19 @@ class SearchResultItem(ListItem):
         self.video_id = video_id
         self.thumb_url = thumb_url
         self.thumb_box = Static("Loading...", classes="thumb_box")
+        self._thumb_started = False
 
     def compose(self) -> ListView.ComposeResult:
         with Horizontal(classes="list_item_row"):
             yield self.thumb_box
             yield Label(f"[b]{self.title_text}[/b]\n[dim]{self.uploader}[/dim]", classes="list_item_label")
 
-    async def on_mount(self) -> None:
-        # Load thumbnail per search result in the background
-        self.run_worker(partial(self._download_thumb), exit_on_error=False)
+    def load_thumb(self) -> None:
+        """Start loading the thumbnail, once; called when the row is in view."""
+        if self._thumb_started:
+            return
+        self._thumb_started = True
+        self.run_worker(self._download_thumb, exit_on_error=False)
 
     async def _download_thumb(self):
         """Download and display thumbnail with caching."""
@@ -43,29 +47,20 @@ class SearchResultItem(ListItem):
             return
         
         try:
-            cache = getattr(self.app, "thumb_cache", {})
-            content: bytes | None = cache.get(self.video_id)
-            
-            if content is None:
-                import asyncio
-                import requests
-                loop = asyncio.get_running_loop()
-                response = await loop.run_in_executor(
-                    None, 
-                    lambda: requests.get(self.thumb_url, timeout=10)
-                )
-                if response.status_code == 200:
-                    content = response.content
-                    cache[self.video_id] = content
+            # Stale loads are cancelled by the app when a new search starts
+            content = await self.app.get_thumb(self.video_id, self.thumb_url)
             
             if content:
-                img_data = BytesIO(content)
-                img_widget = TextualImage(img_data)
+                # Decode up front so the buffer can be released right away
+                with BytesIO(content) as img_data:
+                    image = PILImage.open(img_data)
+                    image.load()
+                img_widget = TextualImage(image)
                 img_widget.styles.width = 8
                 img_widget.styles.height = 3
 
-                for child in list(self.thumb_box.children):
-                    await child.remove()
+                if self.thumb_box.children:
+                    await self.thumb_box.remove_children()
                 self.thumb_box.update("")
                 await self.thumb_box.mount(img_widget)
             else:
@@ -1,12 +1,13 @@
 """Thumbnail widget for displaying video thumbnails."""
 
-from functools import partial
 from io import BytesIO
 
 from textual.widgets import Static
 from textual.containers import Container
 from textual_image.widget import Image as TextualImage
 
+from utils import download_thumbnail
+
 
 class ThumbnailWidget(Container):
     """Handles downloading and displaying the thumbnail.
@@ -14,13 +15,16 @@ class ThumbnailWidget(Container):
     Downloads thumbnails asynchronously to avoid blocking the UI.
     """
 
+    # The player art fills most of the main area, so use the larger variant
+    THUMB_QUALITY = "hqdefault"
+
     def update_image(self, url: str) -> None:
         """Start async thumbnail download.
         
         Args:
             url: Thumbnail image URL
         """
-        self.app.run_worker(partial(self._download_and_set, url), exit_on_error=False)
+        self.app.run_worker(self._download_and_set(url), exit_on_error=False)
 
     async def _download_and_set(self, url: str):
         """Download and display thumbnail."""
@@ -29,17 +33,18 @@ class ThumbnailWidget(Container):
 
         try:
             import asyncio
-            import requests
             
             loop = asyncio.get_running_loop()
-            response = await loop.run_in_executor(None, requests.get, url)
+            content = await loop.run_in_executor(
+                self.app.thumb_pool, download_thumbnail, url
+            )
 
-            if response.status_code == 200:
-                img_data = BytesIO(response.content)
+            if content:
+                img_data = BytesIO(content)
 
                 # Clear existing image
-                for child in self.children:
-                    await child.remove()
+                if self.children:
+                    await self.remove_children()
 
                 # Create new Image widget from textual-image
                 img_widget = TextualImage(img_data)
@@ -10,9 +10,16 @@ Usage:
 
 import asyncio
 import logging
-from functools import partial
-
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import parse_qs, urlparse
+
+from textual import on
 from textual.app import App, ComposeResult
+from textual.message import Message
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
     Header,
@@ -25,11 +32,17 @@ from textual.widgets import (
     Button,
 )
 from textual.reactive import reactive
-from textual.worker import Worker
+from textual.worker import Worker, WorkerState
 
 from player import AudioPlayer
 from widgets import SearchResultItem, PlayerControls, ThumbnailWidget
-from utils import YouTubeSearch, get_thumbnail_url
+from utils import (
+    YouTubeSearch,
+    ThumbnailCache,
+    get_thumbnail_url,
+    load_thumbnail,
+    warm_thumbnail_connection,
+)
 
 # --- Configuration ---
 # Set logging to avoid polluting the TUI
@@ -38,6 +51,51 @@ logging.basicConfig(
     filename="player_debug.log"
 )
 
+# Resolved stream URLs kept per video ID; YouTube signs them with an
+# expiry, and the TTL is only a fallback for URLs without one.
+STREAM_CACHE_SIZE = 64
+STREAM_CACHE_TTL = 4 * 60 * 60
+
+# Rows per search result, matching .result_item in CSS
+RESULT_ITEM_HEIGHT = 4
+
+# Minimum seconds between progress redraws driven by mpv
+PROGRESS_INTERVAL = 0.5
+
+STREAM_YDL_OPTS = {
+    'format': 'bestaudio/best',
+    'quiet': True,
+}
+
+
+def _stream_expiry(url: str) -> float:
+    """Return when a resolved stream URL should stop being reused."""
+    try:
+        expire = parse_qs(urlparse(url).query).get("expire")
+        if expire:
+            # Leave a margin so playback never starts on a dying URL
+            return float(expire[0]) - 60
+    except ValueError:
+        pass
+    return time.time() + STREAM_CACHE_TTL
+
+
+@lru_cache(maxsize=4096)
+def _fmt_time(seconds: int) -> str:
+    """Format whole seconds as MM:SS or HH:MM:SS."""
+    if seconds < 0:
+        return "00:00"
+    m, s = divmod(seconds, 60)
+    h, m = divmod(m, 60)
+    if h:
+        return f"{h:d}:{m:02d}:{s:02d}"
+    return f"{m:02d}:{s:02d}"
+
+
+class TimePosChanged(Message):
+    """Posted from mpv's event thread when the playback position changes."""
+
+
 # --- Main Application ---
 
 
@@ -207,10 +265,27 @@ class YTPlayerApp(App):
     player = AudioPlayer()
     current_video_id = reactive("")
     current_title = reactive("No Media Playing")
-    thumb_cache: dict[str, bytes] = {}
+    thumb_pool: ThreadPoolExecutor | None = None
     _searcher: YouTubeSearch | None = None
+    _search_worker: Worker | None = None
     _allow_auto_play: bool = False
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.thumb_cache = ThumbnailCache()
+        self._stream_cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._stream_pending: dict[str, asyncio.Future[str]] = {}
+        self._thumb_pending: dict[str, asyncio.Task[bytes | None]] = {}
+        # Long-lived YoutubeDL instances for stream extraction, since
+        # building one loads every extractor: one for user-initiated plays,
+        # one for speculative prefetches, so a play never waits on a
+        # prefetch. Each lock keeps executor threads off a busy instance.
+        self._ydl_stream = None
+        self._ydl_stream_lock = threading.Lock()
+        self._ydl_prefetch = None
+        self._ydl_prefetch_lock = threading.Lock()
+        self._reset_progress_state()
+
     def compose(self) -> ComposeResult:
         """Compose the application layout."""
         # Left Sidebar
@@ -242,8 +317,127 @@ class YTPlayerApp(App):
 
     def on_mount(self) -> None:
         """Initialize app on mount."""
-        self.set_interval(0.5, self.update_progress)
+        # Cache widgets touched on every progress tick and status change
+        self._progress_bar = self.query_one("#progress_bar", ProgressBar)
+        self._progress_label = self.query_one("#progress_label", Label)
+        self._elapsed_label = self.query_one("#elapsed_label", Label)
+        self._remaining_label = self.query_one("#remaining_label", Label)
+        self._now_playing_label = self.query_one("#now_playing_label", Label)
+        self._state_label = self.query_one("#state_label", Label)
+        self._status_line = self.query_one("#status_line", Label)
+
+        # Result thumbnails load only for rows inside the list's viewport
+        self.watch(
+            self.query_one("#results_list", ListView),
+            "scroll_y",
+            self._load_visible_thumbs,
+            init=False
+        )
+
+        # mpv pushes position changes, so nothing wakes up while paused/idle
+        self._last_progress_tick = 0.0
+        self._progress_scheduled = False
+        self.player.observe_time(self._on_time_pos)
         self._searcher = YouTubeSearch(max_results=30)
+        # Dedicated pool so thumbnail HTTP never competes with yt-dlp
+        # for the default executor's threads
+        self.thumb_pool = ThreadPoolExecutor(
+            max_workers=8,
+            thread_name_prefix="thumb"
+        )
+        self.run_worker(self._warm_connections, exit_on_error=False)
+
+    def on_unmount(self) -> None:
+        """Release background resources on exit."""
+        self.player.unobserve_time(self._on_time_pos)
+        if self.thumb_pool is not None:
+            self.thumb_pool.shutdown(wait=False, cancel_futures=True)
+        if self._searcher is not None:
+            self._searcher.close()
+        # No lock: exit must not wait on an extraction still in flight
+        for ydl in (self._ydl_stream, self._ydl_prefetch):
+            if ydl is not None:
+                ydl.close()
+
+    async def _warm_connections(self) -> None:
+        """Prime DNS, connections and yt-dlp so the first search starts hot."""
+        assert self._searcher is not None
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            loop.run_in_executor(self.thumb_pool, warm_thumbnail_connection),
+            loop.getaddrinfo("www.youtube.com", 443),
+            loop.run_in_executor(None, self._searcher.warm),
+            loop.run_in_executor(None, self._warm_stream_ydl),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logging.error(f"Warmup error: {result}")
+
+    async def get_thumb(self, video_id: str, url: str) -> bytes | None:
+        """Return a downscaled thumbnail, downloading on cache miss."""
+        # Memory hits return without any disk I/O on the event loop
+        content = self.thumb_cache.get(video_id)
+        if content is not None:
+            return content
+
+        # Join a load already in flight (e.g. the search-time prefetch)
+        task = self._thumb_pending.get(video_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load_thumb(video_id, url))
+            self._thumb_pending[video_id] = task
+            task.add_done_callback(
+                lambda _: self._thumb_pending.pop(video_id, None)
+            )
+        # Shield so one waiter going away doesn't cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _load_thumb(self, video_id: str, url: str) -> bytes | None:
+        """Load a thumbnail from disk, or download and downscale it."""
+        content = await self.thumb_cache.load(video_id)
+        if content is not None:
+            return content
+
+        loop = asyncio.get_running_loop()
+        content = await loop.run_in_executor(
+            self.thumb_pool, load_thumbnail, url
+        )
+        if content is not None:
+            # Only the small PNG is kept; the full JPEG is dropped here
+            self.thumb_cache.set(video_id, content)
+        return content
+
+    def on_resize(self) -> None:
+        """Load thumbnails for rows revealed by a taller terminal."""
+        self.call_after_refresh(self._load_visible_thumbs)
+
+    def _load_visible_thumbs(self) -> None:
+        """Start thumbnail loads for result rows inside the viewport."""
+        list_view = self.query_one("#results_list", ListView)
+        top = int(list_view.scroll_y)
+        bottom = top + list_view.scrollable_content_region.height
+        rows = list_view.children[
+            top // RESULT_ITEM_HEIGHT:(bottom - 1) // RESULT_ITEM_HEIGHT + 1
+        ]
+        for item in rows:
+            if isinstance(item, SearchResultItem):
+                item.load_thumb()
+
+    async def _prefetch_thumbs(self, results: list[dict]) -> None:
+        """Start every result's thumbnail download as soon as it is known."""
+        await asyncio.gather(
+            *(
+                self.get_thumb(item['id'], item['thumbnail'])
+                for item in results
+                if item['thumbnail']
+            ),
+            return_exceptions=True
+        )
+
+    def _cancel_thumb_loads(self) -> None:
+        """Cancel thumbnail loads left over from a previous search."""
+        for task in list(self._thumb_pending.values()):
+            task.cancel()
 
     # --- Actions ---
 
@@ -253,20 +447,24 @@ class YTPlayerApp(App):
         if not query:
             return
 
-        if getattr(self, "_search_busy", False):
-            self.notify("Search already in progress.", severity="warning")
-            return
-
-        self._search_busy = True
+        # A newer query supersedes the one in flight
+        if (
+            self._search_worker is not None
+            and self._search_worker.state in (
+                WorkerState.PENDING, WorkerState.RUNNING
+            )
+        ):
+            self._search_worker.cancel()
 
         list_view = self.query_one("#results_list", ListView)
         list_view.clear()
-        self.query_one("#status_line", Label).update(f"Searching for '{query}'...")
+        self._cancel_thumb_loads()
+        self._status_line.update(f"Searching for '{query}'...")
 
         # Run search in background
-        self.run_worker(
-            partial(self.perform_search, query),
-            exclusive=True,
+        self._search_worker = self.run_worker(
+            self.perform_search(query),
+            group="search",
             exit_on_error=False
         )
 
@@ -278,27 +476,35 @@ class YTPlayerApp(App):
 
             if results:
                 list_view = self.query_one("#results_list", ListView)
-                for item in results:
-                    list_view.append(
-                        SearchResultItem(
-                            title=item['title'],
-                            uploader=item['uploader'],
-                            video_id=item['id'],
-                            thumb_url=item['thumbnail']
-                        )
+                # Overlap the first screenful's thumbnail downloads with
+                # mounting the rows; the rest load as they scroll into view
+                visible = list_view.size.height // RESULT_ITEM_HEIGHT + 1
+                self.run_worker(
+                    self._prefetch_thumbs(results[:visible]),
+                    group="thumbs",
+                    exclusive=True,
+                    exit_on_error=False
+                )
+                await list_view.extend(
+                    SearchResultItem(
+                        title=item['title'],
+                        uploader=item['uploader'],
+                        video_id=item['id'],
+                        thumb_url=item['thumbnail']
                     )
+                    for item in results
+                )
+                self.call_after_refresh(self._load_visible_thumbs)
                 self.notify("Search completed.")
-                self.query_one("#status_line", Label).update("")
+                self._status_line.update("")
             else:
                 self.notify("No results found.", severity="warning")
-                self.query_one("#status_line", Label).update("No results found.")
+                self._status_line.update("No results found.")
 
         except Exception as e:
             logging.error(f"Search error: {e}")
             self.notify(f"Search failed: {e}", severity="error")
-            self.query_one("#status_line", Label).update(f"Search failed: {e}")
-        finally:
-            self._search_busy = False
+            self._status_line.update(f"Search failed: {e}")
 
     async def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle result selection."""
@@ -313,47 +519,121 @@ class YTPlayerApp(App):
         self.current_video_id = item.video_id
 
         # Update UI
-        self.query_one("#now_playing_label", Label).update(
+        self._now_playing_label.update(
             f"[b]{item.title_text}[/b]"
         )
         self.query_one(
             "#thumbnail_container", ThumbnailWidget
-        ).update_image(item.thumb_url)
-        self.query_one("#state_label", Label).update("Loading")
-        self.query_one("#status_line", Label).update("")
+        ).update_image(
+            get_thumbnail_url(item.video_id, ThumbnailWidget.THUMB_QUALITY)
+        )
+        self._state_label.update("Loading")
+        self._status_line.update("")
 
         # Get audio stream URL in background
         self.run_worker(
-            partial(self.fetch_and_play, item.video_id),
+            self.fetch_and_play(item.video_id),
             exit_on_error=False
         )
 
-    async def fetch_and_play(self, video_id: str) -> None:
-        """Fetch audio stream URL and start playback."""
+    def _get_stream_ydl(self, prefetch: bool = False):
+        # Caller must hold the matching lock
+        import yt_dlp
+        if prefetch:
+            if self._ydl_prefetch is None:
+                self._ydl_prefetch = yt_dlp.YoutubeDL(STREAM_YDL_OPTS)
+            return self._ydl_prefetch
+        if self._ydl_stream is None:
+            self._ydl_stream = yt_dlp.YoutubeDL(STREAM_YDL_OPTS)
+        return self._ydl_stream
+
+    def _extract_stream_url(self, video_id: str, prefetch: bool = False) -> str:
+        """Run yt-dlp extraction for a video (blocking)."""
         url = f"https://www.youtube.com/watch?v={video_id}"
+        lock = self._ydl_prefetch_lock if prefetch else self._ydl_stream_lock
+        if lock.acquire(blocking=False):
+            try:
+                ydl = self._get_stream_ydl(prefetch)
+                info = ydl.extract_info(url, download=False)
+            finally:
+                lock.release()
+        else:
+            # Instance busy (e.g. rapid presses); don't queue behind it
+            import yt_dlp
+            with yt_dlp.YoutubeDL(STREAM_YDL_OPTS) as ydl:
+                info = ydl.extract_info(url, download=False)
+        return info['url']
+
+    def _warm_stream_ydl(self) -> None:
+        """Construct the stream yt-dlp instance ahead of first play (blocking)."""
+        with self._ydl_stream_lock:
+            self._get_stream_ydl()
+
+    async def _resolve_stream(
+        self,
+        video_id: str,
+        prefetch: bool = False
+    ) -> str:
+        """Resolve the audio stream URL for a video, reusing cached URLs."""
+        hit = self._stream_cache.get(video_id)
+        if hit and hit[1] > time.time():
+            self._stream_cache.move_to_end(video_id)
+            return hit[0]
+
+        # Join an extraction already in flight (e.g. a prefetch) for this video
+        pending = self._stream_pending.get(video_id)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = loop.run_in_executor(
+                None, self._extract_stream_url, video_id, prefetch
+            )
+            self._stream_pending[video_id] = pending
+            pending.add_done_callback(
+                lambda _: self._stream_pending.pop(video_id, None)
+            )
+        # Shield so cancelling one waiter doesn't cancel it for the others
+        play_url = await asyncio.shield(pending)
 
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'quiet': True,
-        }
+        self._stream_cache[video_id] = (play_url, _stream_expiry(play_url))
+        self._stream_cache.move_to_end(video_id)
+        while len(self._stream_cache) > STREAM_CACHE_SIZE:
+            self._stream_cache.popitem(last=False)
+        return play_url
 
+    async def fetch_and_play(self, video_id: str) -> None:
+        """Fetch audio stream URL and start playback."""
         try:
-            import yt_dlp
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                loop = asyncio.get_running_loop()
-                info = await loop.run_in_executor(
-                    None,
-                    lambda: ydl.extract_info(url, download=False)
-                )
-                play_url = info['url']
-                self.player.play(play_url)
-                self.query_one("#state_label", Label).update("Playing")
-                self.query_one("#status_line", Label).update("")
+            play_url = await self._resolve_stream(video_id)
+            if video_id != self.current_video_id:
+                # A later selection superseded this one while resolving
+                return
+            self.player.play(play_url)
+            self._state_label.update("Playing")
+            self._status_line.update("")
+
+            # Hide extraction latency for the likely next "Next" press
+            self.run_worker(self._prefetch_next, exit_on_error=False)
 
         except Exception as e:
             self.notify(f"Error fetching stream: {e}", severity="error")
-            self.query_one("#state_label", Label).update("Error")
-            self.query_one("#status_line", Label).update(str(e))
+            self._state_label.update("Error")
+            self._status_line.update(str(e))
+
+    async def _prefetch_next(self) -> None:
+        """Resolve the next result's stream URL into the cache."""
+        list_view = self.query_one("#results_list", ListView)
+        next_idx = (list_view.index or 0) + 1
+        if next_idx >= len(list_view.children):
+            return
+
+        item = list_view.children[next_idx]
+        if not isinstance(item, SearchResultItem):
+            return
+
+        try:
+            await self._resolve_stream(item.video_id, prefetch=True)
+        except Exception as e:
+            logging.error(f"Stream prefetch error: {e}")
 
     # --- Controls ---
 
@@ -385,7 +665,7 @@ class YTPlayerApp(App):
             self.query_one("#btn_play_pause", Button).label = (
                 "▶" if paused else "⏸"
             )
-            self.query_one("#state_label", Label).update(
+            self._state_label.update(
                 "Paused" if paused else "Playing"
             )
         except Exception:
@@ -484,28 +764,51 @@ class YTPlayerApp(App):
     def stop_playback(self) -> None:
         """Stop playback and reset UI."""
         self.player.stop()
-        self.query_one("#progress_bar", ProgressBar).update(progress=0)
-        self.query_one("#progress_label", Label).update("0%")
-        self.query_one("#elapsed_label", Label).update("00:00")
-        self.query_one("#remaining_label", Label).update("-00:00")
-        self.query_one("#now_playing_label", Label).update("Stopped")
-        self.query_one("#state_label", Label).update("Stopped")
-
-    def _fmt_time(self, seconds: float | None) -> str:
-        """Format seconds as MM:SS or HH:MM:SS."""
-        if seconds is None or seconds < 0:
-            return "00:00"
-        secs = int(seconds)
-        m, s = divmod(secs, 60)
-        h, m = divmod(m, 60)
-        if h:
-            return f"{h:d}:{m:02d}:{s:02d}"
-        return f"{m:02d}:{s:02d}"
+        self._progress_bar.update(progress=0)
+        self._progress_label.update("0%")
+        self._elapsed_label.update("00:00")
+        self._remaining_label.update("-00:00")
+        self._now_playing_label.update("Stopped")
+        self._state_label.update("Stopped")
+        self._reset_progress_state()
+
+    def _reset_progress_state(self) -> None:
+        """Forget last rendered progress so the next tick redraws it."""
+        self._last_total: float | None = None
+        self._last_curr_int: int | None = None
+        self._last_percent: int | None = None
+        self._last_remaining_int: int | None = None
+
+    def _on_time_pos(self, value: float | None) -> None:
+        """Forward mpv position changes to the UI (runs on mpv's thread)."""
+        # One redraw pending covers every change until it runs
+        if value is None or self._progress_scheduled:
+            return
+        self._progress_scheduled = True
+        # post_message is thread-safe and doesn't wait on the UI loop; the
+        # handler then runs in the app's own context
+        self.post_message(TimePosChanged())
+
+    @on(TimePosChanged)
+    def _schedule_progress(self) -> None:
+        """Redraw progress now, or once PROGRESS_INTERVAL has elapsed."""
+        delay = self._last_progress_tick + PROGRESS_INTERVAL - time.monotonic()
+        if delay <= 0:
+            self._flush_progress()
+        else:
+            self.set_timer(delay, self._flush_progress)
+
+    def _flush_progress(self) -> None:
+        # Reads mpv's current position, so the last change always renders
+        self._progress_scheduled = False
+        self._last_progress_tick = time.monotonic()
+        self.update_progress()
 
     def update_progress(self) -> None:
         """Update progress bar and time labels."""
         try:
-            if getattr(self.player.mpv, "core_idle", False):
+            # core_idle is also set while paused, which would hide seeks
+            if getattr(self.player.mpv, "idle_active", False):
                 return
 
             curr = self.player.get_time_pos()
@@ -517,18 +820,27 @@ class YTPlayerApp(App):
             if total > 0:
                 percent = int((curr / total) * 100)
                 remaining = max(total - curr, 0)
-
-                self.query_one("#progress_bar", ProgressBar).update(
-                    total=total,
-                    progress=curr
-                )
-                self.query_one("#progress_label", Label).update(f"{percent}%")
-                self.query_one("#elapsed_label", Label).update(
-                    self._fmt_time(curr)
-                )
-                self.query_one("#remaining_label", Label).update(
-                    f"-{self._fmt_time(remaining)}"
-                )
+                curr_int = int(curr)
+                remaining_int = int(remaining)
+
+                # Only touch widgets whose displayed value actually changed;
+                # every update triggers a reactive refresh.
+                if total != self._last_total:
+                    self._last_total = total
+                    self._progress_bar.update(total=total, progress=curr)
+                elif curr_int != self._last_curr_int:
+                    self._progress_bar.update(progress=curr)
+                if percent != self._last_percent:
+                    self._last_percent = percent
+                    self._progress_label.update(f"{percent}%")
+                if curr_int != self._last_curr_int:
+                    self._last_curr_int = curr_int
+                    self._elapsed_label.update(_fmt_time(curr_int))
+                if remaining_int != self._last_remaining_int:
+                    self._last_remaining_int = remaining_int
+                    self._remaining_label.update(
+                        f"-{_fmt_time(remaining_int)}"
+                    )
 
         except Exception:
             pass